@@ -1,6 +1,17 @@
+import math
+from functools import lru_cache
 import numpy as np
-from scipy.stats import norm
-from greeks import bs_greeks
+from scipy.optimize import brentq
+from scipy.special import ndtr, ndtri
+from greeks import _INV_SQRT_2PI, _is_call
+
+# Optional compiled (price, vega) kernel - built from bs_kernel.pyx via
+# "python setup.py build_ext --inplace" for environments without numba.
+# Everything works on the pure Python path when it is absent
+try:
+    from bs_kernel import bs_price_vega as _bs_price_vega_c
+except ImportError:
+    _bs_price_vega_c = None
 
 def bs_pricing(S, K, T, r, sigma, option_type, q=0):
     """
@@ -26,24 +37,66 @@ def bs_pricing(S, K, T, r, sigma, option_type, q=0):
 
     # Black-Scholes formula for both call and put options
 
-    if  option_type.lower() == "call":
+    if _is_call(option_type):
         # call option price formula: S*N(d1) - K*e^(-rT)*N(d2)
-        bs_price = S * np.exp(-q * T) * norm.cdf(d1) - K * (np.exp(-r * T)) * norm.cdf(d2)
-    elif option_type.lower() == "put":
+        bs_price = S * np.exp(-q * T) * ndtr(d1) - K * (np.exp(-r * T)) * ndtr(d2)
+    else:
         # put option price formula: K*e^(-rT)*N(-d2) - S*N(-d1)
-        bs_price = K * np.exp(-r * T) * norm.cdf(-d2) - S * np.exp(-q * T) * norm.cdf(-d1)
+        bs_price = K * np.exp(-r * T) * ndtr(-d2) - S * np.exp(-q * T) * ndtr(-d1)
 
     return bs_price
 
-def implied_volatility(market_price, S, K, T, r, option_type, error_tolerance=1e-4, max_iter=100, q=0):
+def bs_pricing_vec(S, K, T, r, sigma, option_type, q=0):
     """
-    Calculate Implied Volatility (forward looking measure of volatility)
+    Calculate option prices with Black-Scholes model over arrays of inputs
+
+    Broadcasting version of bs_pricing: any of S, K, T, sigma may be ndarrays
+    and all strikes/expiries are priced in one vectorized kernel instead of
+    one Python call per option
 
     Parameters:
-        market_price (float): current market option price
-        S (float): current stock price 
-        K (float): strike price
-        T (float): time to expiration in years 
+        S (float or ndarray): current stock price
+        K (float or ndarray): strike price
+        T (float or ndarray): time to expiration in years
+        r (float): risk-free interest rate
+        sigma (float or ndarray): volatility
+        option_type (str): type of option ("call" or "put")
+        q (float): dividend yield (annualized dividend rate as percentage of stock price)
+
+    Returns:
+       option prices (ndarray): fair option prices determined by the model
+    """
+
+    S = np.asarray(S, dtype=float)
+    K = np.asarray(K, dtype=float)
+    T = np.asarray(T, dtype=float)
+    sigma = np.asarray(sigma, dtype=float)
+
+    sqrtT = np.sqrt(T)
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / (sigma * sqrtT)
+    d2 = d1 - sigma * sqrtT
+
+    if _is_call(option_type):
+        return S * np.exp(-q * T) * ndtr(d1) - K * np.exp(-r * T) * ndtr(d2)
+    else:
+        return K * np.exp(-r * T) * ndtr(-d2) - S * np.exp(-q * T) * ndtr(-d1)
+
+def implied_volatility_vec(market_price, S, K, T, r, option_type, error_tolerance=1e-4, max_iter=100, q=0):
+    """
+    Calculate Implied Volatility for arrays of options in parallel
+
+    Runs Halley iterations on whole ndarrays at once: one vector of sigmas is
+    updated per iteration and converged entries are frozen with a boolean
+    mask, so Python only loops over the <= max_iter iterations and never over
+    individual options. Halley's method converges cubically and only needs
+    volga = vega * d1 * d2 / sigma on top of vega, which shares the same
+    d1/d2, so each iteration costs the same as a Newton step
+
+    Parameters:
+        market_price (ndarray): current market option prices
+        S (float or ndarray): current stock price
+        K (float or ndarray): strike price
+        T (float or ndarray): time to expiration in years
         r (float): risk-free interest rate
         option_type (str): type of option ("call" or "put")
         error_tolerance (float): acceptable difference between model and market prices
@@ -51,47 +104,228 @@ def implied_volatility(market_price, S, K, T, r, option_type, error_tolerance=1e
         q (float): dividend yield (annualized dividend rate as percentage of stock price)
 
     Returns:
-        Implied Volatility (float): market forecast of likely sigma (price volatility)
+        Implied Volatilities (ndarray): implied sigma per option, NaN where the solver failed
     """
-    
-    sigma = 0.3
-    
-    # Newton-Raphson Algorithm
+
+    market_price, S, K, T = np.broadcast_arrays(
+        np.asarray(market_price, dtype=float),
+        np.asarray(S, dtype=float),
+        np.asarray(K, dtype=float),
+        np.asarray(T, dtype=float),
+    )
+    is_call = _is_call(option_type)
+
+    # Invariants that do not depend on sigma, hoisted out of the loop
+
+    sqrtT = np.sqrt(T)
+    logSK = np.log(S / K)
+    exp_qT = np.exp(-q * T)
+    exp_rT = np.exp(-r * T)
+    tolerance_price = error_tolerance * np.maximum(1.0, market_price)
+
+    sigma = np.full(market_price.shape, 0.3)
+    done = np.zeros(market_price.shape, dtype=bool)
+
+    # Parallel Halley Algorithm
 
     for i in range(max_iter):
-        model_price = bs_pricing(S, K, T, r, sigma, option_type, q)
-        vega = bs_greeks(S, K, T, r, sigma, option_type, q)["vega"]
-        difference = model_price - market_price
-
-        if abs(difference) < error_tolerance * max(1.0, market_price):
-            return sigma
-        
-        if vega < 1e-8:
+        d1 = (logSK + (r - q + 0.5 * sigma ** 2) * T) / (sigma * sqrtT)
+        d2 = d1 - sigma * sqrtT
+
+        if is_call:
+            price = S * exp_qT * ndtr(d1) - K * exp_rT * ndtr(d2)
+        else:
+            price = K * exp_rT * ndtr(-d2) - S * exp_qT * ndtr(-d1)
+
+        difference = price - market_price
+        done = done | (np.abs(difference) < tolerance_price)
+        if done.all():
             break
 
-        sigma -= difference / vega
-        sigma = max(min(sigma, 5.0), 1e-6)
-    
-    # Backup option if Newton-Raphson fails to converge
+        # Full (not per-1%) vega, so the update step is correctly scaled,
+        # and volga from the same d1/d2 for the second-order correction
+
+        vega = S * exp_qT * _INV_SQRT_2PI * np.exp(-0.5 * d1 * d1) * sqrtT
+        volga = vega * d1 * d2 / sigma
+        denominator = 2 * vega * vega - difference * volga
+        step = np.where(
+            done | (vega < 1e-8) | (np.abs(denominator) < 1e-12),
+            0.0,
+            2 * difference * vega / np.where(np.abs(denominator) < 1e-12, 1.0, denominator),
+        )
+        sigma = np.clip(sigma - step, 1e-6, 5.0)
+
+    return np.where(done, sigma, np.nan)
+
+def _bs_price_given_inv(S, K, sigma, logSK, sqrtT, drift_T, exp_qT, exp_rT, is_call):
+    """
+    Black-Scholes price and full vega from precomputed sigma-invariants
+
+    log(S/K), sqrt(T), (r-q)*T and the discount factors do not change while
+    a root-finder varies sigma, so callers compute them once and pass them
+    in rather than re-deriving them on every iteration
+    """
+
+    srt = sigma * sqrtT
+    d1 = (logSK + drift_T) / srt + 0.5 * srt
+    d2 = d1 - srt
+
+    if is_call:
+        price = S * exp_qT * ndtr(d1) - K * exp_rT * ndtr(d2)
+    else:
+        price = K * exp_rT * ndtr(-d2) - S * exp_qT * ndtr(-d1)
+
+    vega = S * exp_qT * _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1) * sqrtT
+    return price, vega
+
+def _lbr_implied_volatility(market_price, S, K, T, r, is_call, error_tolerance, max_iter, q):
+    """
+    Implied volatility via Jackel's "Let's Be Rational" approach
+
+    Transforms the option to normalized Black form (x = log(F/K),
+    beta = undiscounted price / sqrt(F*K)), reduces to the out-of-the-money
+    time value via put-call parity and symmetry, then polishes the total
+    volatility s = sigma*sqrt(T) with third-order Householder updates, which
+    converge in a handful of iterations where Newton needs ~10 and stalls
+    when vega is near zero
+
+    Returns the implied sigma, or None when the price violates arbitrage
+    bounds or the iteration fails (callers fall back to bisection)
+    """
+
+    if market_price <= 0 or T <= 0:
+        return None
+
+    # Normalized Black transform
+
+    F = S * math.exp((r - q) * T)
+    discount = math.exp(-r * T)
+    undiscounted = market_price / discount
+    if not is_call:
+        # Put-call parity on undiscounted prices: c = p + F - K
+        undiscounted += F - K
+
+    sqrtFK = math.sqrt(F * K)
+    x = math.log(F / K)
+    b = undiscounted / sqrtFK
+
+    # Reduce to out-of-the-money time value: b(x, s) - intrinsic = b(-|x|, s)
+
+    intrinsic = max(math.exp(0.5 * x) - math.exp(-0.5 * x), 0.0)
+    beta = b - intrinsic
+    x = -abs(x)
+    b_max = math.exp(0.5 * x)
+
+    # Arbitrage bounds on the normalized time value
+
+    if not (0.0 < beta < b_max):
+        return None
+
+    # Initial guess: the inflection point s = sqrt(2|x|) of b in s, or the
+    # exact ATM inversion beta = 2*N(s/2) - 1 when x ~ 0
+
+    if x < -1e-10:
+        s = math.sqrt(-2.0 * x)
+    else:
+        s = 2.0 * ndtri(0.5 * (1.0 + beta))
+        if s <= 0.0:
+            return None
+
+    tolerance = error_tolerance * max(1.0, market_price) / (discount * sqrtFK)
+    sqrtT = math.sqrt(T)
 
-    low = 1e-6
-    high = 5.0
-    tolerance_price = error_tolerance * max(1.0, market_price)
+    # Householder (third order) iterations on the normalized Black function
 
     for i in range(max_iter):
-        mid = (low + high) / 2
-        price = bs_pricing(S, K, T, r, mid, option_type, q)
-
-        if abs(price  - market_price) < tolerance_price:
-            return mid
-        
-        if price > market_price:
-            high = mid
-        else:
-            low = mid
-    
+        d = x / s
+        diff = math.exp(0.5 * x) * ndtr(d + 0.5 * s) - math.exp(-0.5 * x) * ndtr(d - 0.5 * s) - beta
+
+        if abs(diff) < tolerance:
+            return s / sqrtT
+
+        # Normalized vega and log-derivative ratios b''/b', b'''/b'
+        b_prime = _INV_SQRT_2PI * math.exp(-0.5 * d * d - 0.125 * s * s)
+        if b_prime < 1e-300:
+            return None
+        nu = -diff / b_prime
+        h2 = d * d / s - 0.25 * s
+        h3 = h2 * h2 - 3.0 * (d * d / (s * s)) - 0.25
+
+        s_next = s + nu * (1.0 + 0.5 * h2 * nu) / (1.0 + nu * (h2 + nu * h3 / 6.0))
+        if not math.isfinite(s_next) or s_next <= 0.0:
+            return None
+        s = s_next
+
     return None
-    
+
+@lru_cache(maxsize=4096)
+def _implied_volatility(market_price, S, K, T, r, option_type, error_tolerance, max_iter, q):
+    # Memoized core of implied_volatility; the public wrapper rounds the
+    # float inputs into stable cache keys
+
+    # Resolve the option type to a flag once; everything below branches on it
+
+    is_call = _is_call(option_type)
+
+    # "Let's Be Rational" style solver: normalized Black transform plus
+    # Householder iterations, converging in a handful of steps where the old
+    # Newton-Raphson loop needed ~10 and stalled on deep OTM/ITM options
+
+    sigma = _lbr_implied_volatility(market_price, S, K, T, r, is_call, error_tolerance, max_iter, q)
+    if sigma is not None:
+        return sigma
+
+    # Backup option when the price is outside arbitrage bounds or the
+    # rational solver fails to converge: brentq brackets like bisection but
+    # converges superlinearly via inverse quadratic interpolation. The
+    # sigma-invariants are computed once outside the objective instead of
+    # inside bs_pricing every evaluation
+
+    sqrtT = math.sqrt(T)
+    logSK = math.log(S / K)
+    drift_T = (r - q) * T
+    exp_qT = math.exp(-q * T)
+    exp_rT = math.exp(-r * T)
+
+    if _bs_price_vega_c is not None:
+        def objective(sigma):
+            return _bs_price_vega_c(S, K, T, r, q, sigma, is_call)[0] - market_price
+    else:
+        def objective(sigma):
+            price, _ = _bs_price_given_inv(S, K, sigma, logSK, sqrtT, drift_T, exp_qT, exp_rT, is_call)
+            return price - market_price
+
+    try:
+        return brentq(objective, 1e-6, 5.0, xtol=error_tolerance * max(1.0, market_price), maxiter=max_iter)
+    except ValueError:
+        # Root not bracketed in [1e-6, 5] - no implied volatility exists
+        return None
+
+def implied_volatility(market_price, S, K, T, r, option_type, error_tolerance=1e-4, max_iter=100, q=0):
+    """
+    Calculate Implied Volatility (forward looking measure of volatility)
+
+    Results are memoized (lru_cache, 4096 entries) on rounded inputs, so
+    re-plotting the same surface skips the solve entirely; market_price is
+    rounded to 4 decimals and T to 6, both well inside error_tolerance
+
+    Parameters:
+        market_price (float): current market option price
+        S (float): current stock price
+        K (float): strike price
+        T (float): time to expiration in years
+        r (float): risk-free interest rate
+        option_type (str): type of option ("call" or "put")
+        error_tolerance (float): acceptable difference between model and market prices
+        max_iter (int): maximum number of iterations of the solver
+        q (float): dividend yield (annualized dividend rate as percentage of stock price)
+
+    Returns:
+        Implied Volatility (float): market forecast of likely sigma (price volatility)
+    """
+
+    return _implied_volatility(round(market_price, 4), S, K, round(T, 6), r, option_type.lower(), error_tolerance, max_iter, q)
+
 # Test Call
 
 if __name__ == "__main__":
@@ -0,0 +1,149 @@
+import math
+import numpy as np
+from numba import njit, prange
+
+# Numba-compiled scalar kernels for Black-Scholes pricing and implied
+# volatility. These avoid all Python/scipy dispatch inside the Newton loop:
+# the normal CDF is a hand-inlined Abramowitz & Stegun erf approximation
+# (formula 7.1.26, max abs error ~1.5e-7) with explicit sign handling,
+# validated against scipy.special.ndtr. cache=True keeps the compiled
+# kernels on disk so the JIT cost is only paid once.
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2 * math.pi)
+_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+
+@njit(cache=True, fastmath=True)
+def _ndtr(x):
+    # N(x) = 0.5 * (1 + erf(x / sqrt(2))), erf via Abramowitz & Stegun 7.1.26
+    z = x * _INV_SQRT_2
+    sign = 1.0
+    if z < 0.0:
+        sign = -1.0
+        z = -z
+    t = 1.0 / (1.0 + 0.3275911 * z)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * math.exp(-z * z)
+    return 0.5 * (1.0 + sign * erf)
+
+@njit(cache=True, fastmath=True)
+def _bs_call(S, K, T, r, q, sigma):
+    sqrtT = math.sqrt(T)
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrtT)
+    d2 = d1 - sigma * sqrtT
+    return S * math.exp(-q * T) * _ndtr(d1) - K * math.exp(-r * T) * _ndtr(d2)
+
+@njit(cache=True, fastmath=True)
+def _bs_put(S, K, T, r, q, sigma):
+    sqrtT = math.sqrt(T)
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrtT)
+    d2 = d1 - sigma * sqrtT
+    return K * math.exp(-r * T) * _ndtr(-d2) - S * math.exp(-q * T) * _ndtr(-d1)
+
+@njit(cache=True, fastmath=True)
+def _vega(S, K, T, r, q, sigma):
+    sqrtT = math.sqrt(T)
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrtT)
+    return S * math.exp(-q * T) * _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1) * sqrtT
+
+@njit(cache=True, fastmath=True)
+def _iv(market_price, S, K, T, r, q, is_call, error_tolerance, max_iter):
+    sigma = 0.3
+    tolerance_price = error_tolerance * max(1.0, market_price)
+
+    # Newton-Raphson Algorithm
+
+    for i in range(max_iter):
+        if is_call:
+            model_price = _bs_call(S, K, T, r, q, sigma)
+        else:
+            model_price = _bs_put(S, K, T, r, q, sigma)
+        difference = model_price - market_price
+
+        if abs(difference) < tolerance_price:
+            return sigma
+
+        vega = _vega(S, K, T, r, q, sigma)
+        if vega < 1e-8:
+            break
+
+        sigma -= difference / vega
+        sigma = max(min(sigma, 5.0), 1e-6)
+
+    # Backup option if Newton-Raphson fails to converge
+
+    low = 1e-6
+    high = 5.0
+
+    for i in range(max_iter):
+        mid = (low + high) / 2
+        if is_call:
+            price = _bs_call(S, K, T, r, q, mid)
+        else:
+            price = _bs_put(S, K, T, r, q, mid)
+
+        if abs(price - market_price) < tolerance_price:
+            return mid
+
+        if price > market_price:
+            high = mid
+        else:
+            low = mid
+
+    return math.nan
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _mc_price(S, K, T, r, q, sigma, n, is_call):
+    # Loop-style Monte Carlo kernel: RNG draw, GBM exponential, payoff and
+    # reduction fused into one streaming prange loop with no intermediate
+    # arrays (numpy-style code allocates a temporary per ufunc). Antithetic
+    # pairs (z, -z) are both priced per iteration, matching mc_pricing's
+    # variance reduction.
+    drift = (r - q - 0.5 * sigma * sigma) * T
+    vol = sigma * math.sqrt(T)
+    half = (n + 1) // 2
+    total = 0.0
+    for i in prange(half):
+        z = np.random.standard_normal()
+        f_up = S * math.exp(drift + vol * z)
+        f_down = S * math.exp(drift - vol * z)
+        if is_call:
+            if f_up > K:
+                total += f_up - K
+            if f_down > K:
+                total += f_down - K
+        else:
+            if f_up < K:
+                total += K - f_up
+            if f_down < K:
+                total += K - f_down
+    return math.exp(-r * T) * total / (2 * half)
+
+# Thin Python wrappers keeping the string-typed public API
+
+def bs_pricing_fast(S, K, T, r, sigma, option_type, q=0):
+    if option_type.lower() == "call":
+        return _bs_call(S, K, T, r, q, sigma)
+    elif option_type.lower() == "put":
+        return _bs_put(S, K, T, r, q, sigma)
+
+def implied_volatility_fast(market_price, S, K, T, r, option_type, error_tolerance=1e-4, max_iter=100, q=0):
+    iv = _iv(market_price, S, K, T, r, q, option_type.lower() == "call", error_tolerance, max_iter)
+    return None if math.isnan(iv) else iv
+
+def mc_pricing_fast(S, K, T, r, sigma, option_type, n, q=0):
+    return _mc_price(S, K, T, r, q, sigma, n, option_type.lower() == "call")
+
+# Test call
+
+if __name__ == "__main__":
+    from scipy.special import ndtr
+    import numpy as np
+
+    xs = np.linspace(-8, 8, 10001)
+    max_err = max(abs(_ndtr(float(x)) - ndtr(x)) for x in xs)
+    print(f"Max |_ndtr - scipy ndtr| error: {max_err:.2e}")
+
+    call = bs_pricing_fast(100, 100, 1, 0.05, 0.2, "call")
+    iv = implied_volatility_fast(call, 100, 100, 1, 0.05, "call")
+    print(f"Call: {call}")
+    print(f"Implied volatility: {iv}")
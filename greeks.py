@@ -1,7 +1,29 @@
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
 import math
 
+# Standard normal pdf constant and helper (faster than scipy.stats.norm.pdf,
+# which builds a frozen distribution object on every call)
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2 * math.pi)
+
+def _pdf(x):
+    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+# Shared PCG64 generator - faster than the legacy Mersenne Twister global
+# state and seedable per call through the rng parameter
+_RNG = np.random.default_rng()
+
+def _is_call(option_type):
+    # Resolve the option_type string to a bool once at the API boundary so
+    # hot loops branch on a flag instead of repeating str.lower() compares
+    option_type = option_type.lower()
+    if option_type == "call":
+        return True
+    if option_type == "put":
+        return False
+    raise ValueError(f'option_type must be "call" or "put", got {option_type!r}')
+
 # Helper functions for Black-Scholes
 
 def d_1(S, K, T, r, sigma, q=0):
@@ -30,18 +52,32 @@ def bs_greeks(S, K, T, r, sigma, option_type, q=0):
     """
 
     # Calculate Greeks using partial derivatives of Black-Scholes formula
-
-    if option_type.lower() == "call":
-        delta = math.exp(-q * T) * norm.cdf(d_1(S, K, T, r, sigma, q))
-        theta = -(S * norm.pdf(d_1(S, K, T, r, sigma, q)) * sigma * math.exp(-q * T) / (2 * math.sqrt(T)) + q * S * norm.cdf(d_1(S, K, T, r, sigma, q)) * math.exp(-q * T) - r * K * math.exp(-r * T) * norm.cdf(d_2(S, K, T, r, sigma, q)))
-        rho = K * T * math.exp(-r * T) * norm.cdf(d_2(S, K, T, r, sigma, q))
-    elif option_type.lower() == "put":
-        delta = math.exp(-q * T) * (norm.cdf(d_1(S, K, T, r, sigma, q)) - 1)
-        theta = -(S * norm.pdf(d_1(S, K, T, r, sigma, q)) * sigma * math.exp(-q * T) / (2 * math.sqrt(T)) - q * S * norm.cdf(-d_1(S, K, T, r, sigma, q)) * math.exp(-q * T) + r * K * math.exp(-r * T) * norm.cdf(-d_2(S, K, T, r, sigma, q)))
-        rho = -K * T * math.exp(-r * T) * norm.cdf(-d_2(S, K, T, r, sigma, q))
-
-    gamma = math.exp(-q * T) * norm.pdf(d_1(S, K, T, r, sigma, q)) / (S * sigma * math.sqrt(T))
-    vega = S * math.exp(-q * T) * norm.pdf(d_1(S, K, T, r, sigma, q)) * math.sqrt(T) / 100
+    # Every shared subexpression (sqrt(T), log(S/K), d1/d2, discount factors,
+    # N(d1)/N(d2), pdf(d1)) is computed exactly once and reused
+
+    is_call = _is_call(option_type)
+
+    sqrtT = math.sqrt(T)
+    logSK = math.log(S / K)
+    d1 = (logSK + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrtT)
+    d2 = d1 - sigma * sqrtT
+    eq = math.exp(-q * T)
+    er = math.exp(-r * T)
+    Nd1 = ndtr(d1)
+    Nd2 = ndtr(d2)
+    nd1 = _pdf(d1)
+
+    if is_call:
+        delta = eq * Nd1
+        theta = -(S * nd1 * sigma * eq / (2 * sqrtT) + q * S * Nd1 * eq - r * K * er * Nd2)
+        rho = K * T * er * Nd2
+    else:
+        delta = eq * (Nd1 - 1)
+        theta = -(S * nd1 * sigma * eq / (2 * sqrtT) - q * S * (1 - Nd1) * eq + r * K * er * (1 - Nd2))
+        rho = -K * T * er * (1 - Nd2)
+
+    gamma = eq * nd1 / (S * sigma * sqrtT)
+    vega = S * eq * nd1 * sqrtT / 100
 
     # Sort Greeks into dictionary
 
@@ -56,7 +92,7 @@ def bs_greeks(S, K, T, r, sigma, option_type, q=0):
     return greeks
     
 
-def mc_greeks(S, K, T, r, sigma, option_type, n, h, dt, q=0):
+def mc_greeks(S, K, T, r, sigma, option_type, n, h, dt, q=0, rng=None):
     """
     Calculate greeks for monte carlo options pricing model
     Uses pathwise / finite difference methods
@@ -72,62 +108,86 @@ def mc_greeks(S, K, T, r, sigma, option_type, n, h, dt, q=0):
         h: bump size for finite difference (for gamma)
         dt: change in time for finite difference (for theta)
         q (float): dividend yield (annualized dividend rate as percentage of stock price)
+        rng (np.random.Generator): optional generator for reproducible draws
 
     Returns:
        greek (float): sensitivity of option price to differentiation variable
     """
-    
+
+    is_call = _is_call(option_type)
+
     # Randomly generate n numbers (shock factors) using normal distribution
-    Z  = np.random.standard_normal(n)
+    # float32 arrays: MC sampling error dwarfs float32 precision, and the
+    # smaller elements halve memory traffic on every pass; the mean
+    # reductions below accumulate in float64 so the finite differences stay
+    # accurate
+    Z  = (rng or _RNG).standard_normal(n, dtype=np.float32)
 
     # Calculate stock prices using Geomatric Brownian Motion
-    final_stock_price = S * np.exp((r - q - 0.5 * (sigma ** 2)) * T + sigma * np.sqrt(T) * Z)
+    # The exponential factor only depends on drift, vol and Z, so it is
+    # computed once and shared by the baseline and bumped-spot simulations.
+    # The scalar coefficients are cast to float32 once - a float64 scalar
+    # would promote the whole Z array back to float64
+    drift = r - q - 0.5 * (sigma ** 2)
+    drift_T = np.float32(drift * T)
+    vol = np.float32(sigma * math.sqrt(T))
+    E = np.exp(drift_T + vol * Z)
+    final_stock_price = S * E
 
     # Calculate payoff for calls and puts (0 if option is OTM)
-    if option_type.lower() == "call":
+    if is_call:
         payoff = np.maximum(final_stock_price - K, 0)
-    elif option_type.lower() == "put":
+    else:
         payoff = np.maximum(K - final_stock_price, 0)
    
     # Calculate fair price by taking mean of payoffs and adjusting
-    option_price = np.exp(-r * T) * np.mean(payoff)
+    option_price = np.exp(-r * T) * np.mean(payoff, dtype=np.float64)
 
     # Calculate Greeks using pathwise derivatves of Monte Carlo simulations
     # Pathwise derivative = We simulate using Monte Carlo and see how our option price moves for each path with respect to changes in our other variables
-    if option_type.lower() == "call":
-        delta = np.exp(-r * T) * np.mean((final_stock_price > K) * final_stock_price / S)
-        vega = np.exp(-r * T) * np.mean((final_stock_price > K) * final_stock_price * np.sqrt(T) * Z) / 100
-        rho = np.exp(-r * T) * np.mean((final_stock_price > K) * final_stock_price * T)
-    elif option_type.lower() == "put":
-        delta = np.exp(-r * T) * np.mean((final_stock_price < K) * (-final_stock_price / S))
-        vega = np.exp(-r * T) * np.mean((final_stock_price < K) * (-final_stock_price * np.sqrt(T) * Z)) / 100
-        rho = np.exp(-r * T) * np.mean((final_stock_price < K) * (-final_stock_price * T))
+    # The ITM mask and masked stock prices are built once and shared by the
+    # delta/vega/rho reductions instead of three separate masked passes;
+    # scalar factors (S, T, discount) are pulled out of the means
+    discount = np.exp(-r * T)
+    if is_call:
+        masked_price = np.where(final_stock_price > K, final_stock_price, 0.0)
+        masked_mean = np.mean(masked_price, dtype=np.float64)
+        delta = discount * masked_mean / S
+        vega = discount * np.sqrt(T) * np.mean(masked_price * Z, dtype=np.float64) / 100
+        rho = discount * T * masked_mean
+    else:
+        masked_price = np.where(final_stock_price < K, final_stock_price, 0.0)
+        masked_mean = np.mean(masked_price, dtype=np.float64)
+        delta = -discount * masked_mean / S
+        vega = -discount * np.sqrt(T) * np.mean(masked_price * Z, dtype=np.float64) / 100
+        rho = -discount * T * masked_mean
     
-    # Finite difference methods for Gamma
-    stock_price_up = (S + h) * np.exp((r - q - 0.5 * (sigma ** 2)) * T + sigma * np.sqrt(T) * Z)
-    stock_price_down = (S - h) * np.exp((r - q - 0.5 * (sigma ** 2)) * T + sigma * np.sqrt(T) * Z)
+    # Finite difference methods for Gamma (same E, just a rescaled spot)
+    stock_price_up = (S + h) * E
+    stock_price_down = (S - h) * E
 
-    if option_type.lower() == "call":
+    if is_call:
         payoff_up = np.maximum(stock_price_up - K, 0)
         payoff_down = np.maximum(stock_price_down - K, 0)
-    elif option_type.lower() == "put":
+    else:
         payoff_up = np.maximum(K - stock_price_up, 0)
         payoff_down = np.maximum(K - stock_price_down, 0)
     
-    option_price_up = np.exp(-r * T) * np.mean(payoff_up)
-    option_price_down = np.exp(-r * T) * np.mean(payoff_down)
+    option_price_up = np.exp(-r * T) * np.mean(payoff_up, dtype=np.float64)
+    option_price_down = np.exp(-r * T) * np.mean(payoff_down, dtype=np.float64)
     
     gamma = (option_price_up - 2 * option_price + option_price_down) / (h ** 2)
 
     # Finite difference methods for Theta
     time_dt = max(T - dt, 1e-8)
-    final_price_dt = S * np.exp((r - q - 0.5 * (sigma ** 2)) * time_dt + sigma * np.sqrt(time_dt) * Z)
+    E_dt = np.exp(np.float32(drift * time_dt) + np.float32(sigma * math.sqrt(time_dt)) * Z)
+    final_price_dt = S * E_dt
     
-    if option_type.lower() == "call":
+    if is_call:
         payoff_dt = np.maximum(final_price_dt - K, 0)
-    elif option_type.lower() == "put":
+    else:
         payoff_dt = np.maximum(K - final_price_dt, 0)
-    price_dt = np.exp(-r * time_dt) * np.mean(payoff_dt)
+    price_dt = np.exp(-r * time_dt) * np.mean(payoff_dt, dtype=np.float64)
 
     theta = (price_dt - option_price) / dt
 
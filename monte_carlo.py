@@ -1,47 +1,112 @@
 import numpy as np
+from greeks import _is_call
 
-def mc_pricing(S, K, T, r, sigma, option_type, n, q=0):
+# Shared PCG64 generator - faster than the legacy Mersenne Twister global
+# state and seedable per call through the rng parameter
+_RNG = np.random.default_rng()
+
+# Numba-compiled single-pass pricing kernel; the numpy path below stays as
+# the fallback for environments without numba and for seeded rng draws
+try:
+    from fast_bs import _mc_price
+except ImportError:
+    _mc_price = None
+
+# Optional numexpr for the fallback path: fuses the GBM exponential and
+# payoff into one compiled pass over Z instead of a temporary per ufunc
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+def mc_pricing(S, K, T, r, sigma, option_type, n, q=0, rng=None):
     """
     Calculate option price with Monte Carlo methods
-     
+
     Parameters:
-        S (float): current stock price 
+        S (float): current stock price
         K (float): strike price
-        T (float): time to expiration in years 
+        T (float): time to expiration in years
         r (float): risk-free interest rate
         sigma (float): volatility
         option_type (str) : "call" or "put"
         n (int): number of simulations
         q (float): dividend yield (annualized dividend rate as percentage of stock price)
+        rng (np.random.Generator): optional generator for reproducible draws
 
     Returns:
         option price (float): fair call/put option price based on n simulations
     """
-   
-    # Randomly generate n numbers (shock factors) using normal distribution
-    Z = np.random.standard_normal(n)
-
-    # Calculate stock prices using Geomatric Brownian Motion
-    final_stock_price = S * np.exp((r - q - 0.5 * (sigma ** 2)) * T + sigma * np.sqrt(T) * Z)
-
-    # Calculate payoff for calls and puts (0 if option is OTM)
-    if option_type.lower() == 'call':
-        option_payoff = np.maximum(final_stock_price - K, 0)
-    elif option_type.lower() == 'put':
-        option_payoff = np.maximum(K - final_stock_price, 0)
-    
+
+    is_call = _is_call(option_type)
+
+    # Fused loop kernel: RNG + exponential + payoff + reduction in one
+    # streaming pass with no intermediate arrays, parallelized across cores.
+    # Only usable when the caller does not need a specific generator, since
+    # the kernel draws from numba's own thread-local RNG
+    if rng is None and _mc_price is not None:
+        return _mc_price(S, K, T, r, q, sigma, n, is_call)
+
+    # Randomly generate shock factors using normal distribution
+    # Antithetic variates: draw half the shocks and mirror them (Z, -Z) so
+    # the paths come in negatively correlated pairs, cutting the variance of
+    # the payoff mean for the same n simulations
+    # float32 throughout: the MC sampling error (~1%) dwarfs float32
+    # precision, and halving the bytes moved doubles SIMD throughput on the
+    # exp/max/mean passes
+    half = (n + 1) // 2
+    Z_half = (rng or _RNG).standard_normal(half, dtype=np.float32)
+    Z = np.concatenate((Z_half, -Z_half))[:n]
+
+    # Calculate stock prices and payoffs using Geomatric Brownian Motion
+    # The scalar coefficients are cast to float32 once so the ufuncs keep
+    # Z's dtype - a float64 scalar would promote the whole array back to
+    # float64. numexpr evaluates the whole expression in one streaming pass;
+    # the plain numpy version materializes a temporary per ufunc
+    drift_T = np.float32((r - q - 0.5 * (sigma ** 2)) * T)
+    vol = np.float32(sigma * np.sqrt(T))
+    if ne is not None:
+        S_ = np.float32(S)
+        K_ = np.float32(K)
+        if is_call:
+            option_payoff = ne.evaluate("S_ * exp(drift_T + vol * Z) - K_")
+        else:
+            option_payoff = ne.evaluate("K_ - S_ * exp(drift_T + vol * Z)")
+        np.maximum(option_payoff, 0, out=option_payoff)
+    else:
+        final_stock_price = S * np.exp(drift_T + vol * Z)
+
+        # Calculate payoff for calls and puts (0 if option is OTM)
+        if is_call:
+            option_payoff = np.maximum(final_stock_price - K, 0)
+        else:
+            option_payoff = np.maximum(K - final_stock_price, 0)
+
     # Calculate fair price by taking mean of payoffs and adjusting
-    mc_price = np.exp(-r * T) * np.mean(option_payoff)
-    return mc_price
+    # (mean accumulates in float64, then back to a plain Python float)
+    mc_price = np.exp(-r * T) * np.mean(option_payoff, dtype=np.float64)
+    return float(mc_price)
 
 
 # Calculate Monte Carlo prices for increasing simulation (n) values
-def mc_convergence(S, K, T, r, sigma, option_type, q, n_values):
-    prices = []
-    for sim_num in n_values:
-        price = mc_pricing(S, K, T, r, sigma, option_type, sim_num, q=q)
-        prices.append(float(price))
-    return prices
+# Simulates once at the largest n and reads each price off a prefix mean of
+# the cumulative payoff sum, so smaller n values reuse the same paths (nested
+# samples) instead of re-drawing and re-exponentiating from scratch
+def mc_convergence(S, K, T, r, sigma, option_type, q, n_values, rng=None):
+    is_call = _is_call(option_type)
+    n_max = max(n_values)
+
+    Z = (rng or _RNG).standard_normal(n_max, dtype=np.float32)
+    # float32 scalar coefficients so the ufuncs keep Z's dtype
+    final_stock_price = S * np.exp(np.float32((r - q - 0.5 * (sigma ** 2)) * T) + np.float32(sigma * np.sqrt(T)) * Z)
+    if is_call:
+        payoff = np.maximum(final_stock_price - K, 0)
+    else:
+        payoff = np.maximum(K - final_stock_price, 0)
+
+    cumulative = np.cumsum(payoff, dtype=np.float64)
+    discount = np.exp(-r * T)
+    return [float(discount * cumulative[n - 1] / n) for n in n_values]
 
 # Test call
 if __name__ == "__main__":
@@ -0,0 +1,21 @@
+from setuptools import Extension, setup
+
+# Builds the optional compiled Black-Scholes kernel (bs_kernel.pyx).
+# The project runs fine without it; black_scholes.py falls back to the
+# pure Python implementation when the extension is absent.
+#     python setup.py build_ext --inplace
+
+from Cython.Build import cythonize
+
+setup(
+    name="options-pricing-system",
+    ext_modules=cythonize(
+        [
+            Extension(
+                "bs_kernel",
+                ["bs_kernel.pyx"],
+                extra_compile_args=["-O3", "-march=native", "-ffast-math"],
+            )
+        ]
+    ),
+)
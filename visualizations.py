@@ -2,41 +2,80 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from black_scholes import bs_pricing, implied_volatility
+from black_scholes import bs_pricing, implied_volatility_vec
 from monte_carlo import mc_pricing
 from greeks import bs_greeks
 
+# Shared market data for the AMZN surface plots: both visualizations read
+# the same option chain, so it lives at module scope and the IV surface is
+# solved once and reused
+
+STOCK_PRICE = 232.50
+RISK_FREE_RATE = 0.0422
+OPTION_DATES = ["2025-10-18", "2025-11-15", "2025-12-20", "2026-01-17", "2026-03-20"]
+DAYS = np.array([30, 45, 60, 90, 180])
+STRIKES = np.array([200, 205, 210, 215, 220, 225, 230, 235, 240, 245, 250, 255, 260], dtype=float)
+
+# Market option prices, PRICES[i, j] = quote for DAYS[i] / STRIKES[j]
+# (NaN marks strikes without a quote; they are masked out before solving)
+PRICES = np.array([
+    [33.2, 29.1, 24.8, 20.9, 17.1, 13.8, 11.2, 8.9, 6.8, 5.2, 3.9, 2.9, 2.1],
+    [35.6, 31.8, 27.9, 24.2, 20.8, 17.8, 15.1, 12.7, 10.7, 8.9, 7.4, 6.1, 5.0],
+    [37.8, 34.2, 30.5, 27.1, 24.0, 21.1, 18.6, 16.2, 14.2, 12.3, 10.8, 9.4, 8.1],
+    [40.9, 37.5, 34.2, 31.1, 28.1, 25.4, 22.8, 20.5, 18.4, 16.4, 14.9, 13.4, 12.0],
+    [46.5, 43.6, 40.8, 38.2, 35.7, 33.4, 31.2, 29.1, 27.1, 25.3, 23.6, 22.0, 20.5],
+])
+
+_iv_surface_cache = None
+
+def option_iv_surface():
+    """
+    Solve the implied volatility surface for the shared option chain
+
+    Flattens the PRICES grid against STRIKES and the expiry times, masks out
+    NaN cells, solves every quote with one call to implied_volatility_vec,
+    and caches the result so the delta and IV visualizations share a single
+    solve
+
+    Returns:
+        (strikes, times, prices, ivs): 1-D float ndarrays, one entry per quoted option
+    """
+    global _iv_surface_cache
+    if _iv_surface_cache is not None:
+        return _iv_surface_cache
+
+    today = datetime.today().date()
+    expiry_times = np.array([
+        (datetime.strptime(date, "%Y-%m-%d").date() - today).days / 252
+        for date in OPTION_DATES
+    ])
+
+    strike_grid = np.broadcast_to(STRIKES, PRICES.shape)
+    time_grid = np.broadcast_to(expiry_times[:, None], PRICES.shape)
+    quoted = ~np.isnan(PRICES)
+
+    strikes = strike_grid[quoted]
+    times = time_grid[quoted]
+    prices = PRICES[quoted]
+    ivs = implied_volatility_vec(prices, STOCK_PRICE, strikes, times, RISK_FREE_RATE, "call")
+
+    _iv_surface_cache = (strikes, times, prices, ivs)
+    return _iv_surface_cache
+
 def option_delta_visualization():
-    stock_price = 232.50
-    option_dates = ["2025-10-18", "2025-11-15", "2025-12-20", "2026-01-17", "2026-03-20"]
     times = []
     strikes = []
     deltas = []
-    
-    # Market option prices
-    option_prices = {
-        (200, 30): 33.2, (210, 30): 24.8, (220, 30): 17.1, (230, 30): 11.2, (240, 30): 6.8, (250, 30): 3.9, (260, 30): 2.1,
-        (200, 45): 35.6, (210, 45): 27.9, (220, 45): 20.8, (230, 45): 15.1, (240, 45): 10.7, (250, 45): 7.4, (260, 45): 5.0,
-        (200, 60): 37.8, (210, 60): 30.5, (220, 60): 24.0, (230, 60): 18.6, (240, 60): 14.2, (250, 60): 10.8, (260, 60): 8.1,
-        (200, 90): 40.9, (210, 90): 34.2, (220, 90): 28.1, (230, 90): 22.8, (240, 90): 18.4, (250, 90): 14.9, (260, 90): 12.0,
-        (200, 180): 46.5, (210, 180): 40.8, (220, 180): 35.7, (230, 180): 31.2, (240, 180): 27.1, (250, 180): 23.6, (260, 180): 20.5
-    }
-    
-    today = datetime.today().date()
-    for i, date in enumerate(option_dates):
-        exp = datetime.strptime(date, "%Y-%m-%d").date()
-        T = (exp - today).days / 252
-        
-        for strike in [200, 210, 220, 230, 240, 250, 260]:
-            days_key = [30, 45, 60, 90, 180][i]
-            if (strike, days_key) in option_prices:
-                market_price = option_prices[(strike, days_key)]
-                iv = implied_volatility(market_price, stock_price, strike, T, 0.0422, "call")
-                if iv:
-                    delta = bs_greeks(stock_price, strike, T, 0.0422, iv, "call", q=0)["delta"]
-                    strikes.append(strike)
-                    deltas.append(delta)
-                    times.append(T)
+
+    surface_strikes, surface_times, _, surface_ivs = option_iv_surface()
+
+    # The delta plot only shows every other strike of the shared chain
+    for strike, T, iv in zip(surface_strikes, surface_times, surface_ivs):
+        if strike % 10 == 0 and not np.isnan(iv):
+            delta = bs_greeks(STOCK_PRICE, strike, T, RISK_FREE_RATE, iv, "call", q=0)["delta"]
+            strikes.append(strike)
+            deltas.append(delta)
+            times.append(T)
 
     plt.figure(figsize=(9,6))
     scat_plot = plt.scatter(strikes, times, c=deltas, cmap="viridis", s=[d*100 for d in deltas], edgecolor="k", alpha=0.8)
@@ -48,35 +87,17 @@ def option_delta_visualization():
     plt.show()
 
 def iv_visualization():
-    stock_price = 232.50
-    option_dates = ["2025-10-18", "2025-11-15", "2025-12-20", "2026-01-17", "2026-03-20"]
     times = []
     strikes = []
     ivs = []
 
-    # Market option prices for IV calculation
-    option_prices = {
-        (200, 30): 33.2, (205, 30): 29.1, (210, 30): 24.8, (215, 30): 20.9, (220, 30): 17.1, (225, 30): 13.8, (230, 30): 11.2, (235, 30): 8.9, (240, 30): 6.8, (245, 30): 5.2, (250, 30): 3.9, (255, 30): 2.9, (260, 30): 2.1,
-        (200, 45): 35.6, (205, 45): 31.8, (210, 45): 27.9, (215, 45): 24.2, (220, 45): 20.8, (225, 45): 17.8, (230, 45): 15.1, (235, 45): 12.7, (240, 45): 10.7, (245, 45): 8.9, (250, 45): 7.4, (255, 45): 6.1, (260, 45): 5.0,
-        (200, 60): 37.8, (205, 60): 34.2, (210, 60): 30.5, (215, 60): 27.1, (220, 60): 24.0, (225, 60): 21.1, (230, 60): 18.6, (235, 60): 16.2, (240, 60): 14.2, (245, 60): 12.3, (250, 60): 10.8, (255, 60): 9.4, (260, 60): 8.1,
-        (200, 90): 40.9, (205, 90): 37.5, (210, 90): 34.2, (215, 90): 31.1, (220, 90): 28.1, (225, 90): 25.4, (230, 90): 22.8, (235, 90): 20.5, (240, 90): 18.4, (245, 90): 16.4, (250, 90): 14.9, (255, 90): 13.4, (260, 90): 12.0,
-        (200, 180): 46.5, (205, 180): 43.6, (210, 180): 40.8, (215, 180): 38.2, (220, 180): 35.7, (225, 180): 33.4, (230, 180): 31.2, (235, 180): 29.1, (240, 180): 27.1, (245, 180): 25.3, (250, 180): 23.6, (255, 180): 22.0, (260, 180): 20.5
-    }
+    surface_strikes, surface_times, _, surface_ivs = option_iv_surface()
 
-    today = datetime.today().date()
-    for i, date in enumerate(option_dates):
-        exp = datetime.strptime(date, "%Y-%m-%d").date()
-        T = (exp - today).days / 252
-        
-        days_key = [30, 45, 60, 90, 180][i]
-        for strike in [200, 205, 210, 215, 220, 225, 230, 235, 240, 245, 250, 255, 260]:
-            if (strike, days_key) in option_prices:
-                market_price = option_prices[(strike, days_key)]
-                iv = implied_volatility(market_price, stock_price, strike, T, 0.0422, "call")
-                if iv:
-                    strikes.append(strike)
-                    times.append(T)
-                    ivs.append(iv)
+    for strike, T, iv in zip(surface_strikes, surface_times, surface_ivs):
+        if not np.isnan(iv):
+            strikes.append(strike)
+            times.append(T)
+            ivs.append(float(iv))
 
     df = pd.DataFrame({
         'time': times,